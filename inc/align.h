@@ -20,3 +20,24 @@
  */
 void align(const char *target, const char *query, int match, int mismatch,
            int gapopen, int gapextend, char *cigar, int *score);
+
+
+/**
+ * Align both strands of `query` to `target` using the `ksw_extz` algorithm,
+ * encoding the target only once. The CIGAR and score of the better-scoring
+ * strand are reported; ties go to the forward strand.
+ *
+ * @param target      reference genome sequence
+ * @param query       contig assembled from variant-associated reads
+ * @param match       score for a nucleotide match
+ * @param mismatch    penalty for a nucleotide mismatch
+ * @param gapopen     gap open penalty
+ * @param gapextend   gap extension penalty
+ * @param cigar       string to which the CIGAR will be written
+ * @param score       int pointer to which the alignment score will be stored
+ * @param strand      int pointer to which the aligned query strand (1 or -1)
+ *                    will be stored
+ */
+void align_both_strands(const char *target, const char *query, int match,
+                        int mismatch, int gapopen, int gapextend, char *cigar,
+                        int *score, int *strand);
@@ -8,6 +8,7 @@
 # -----------------------------------------------------------------------------
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import kevlar
 from kevlar.assemble import assemble_fml_asm
 from kevlar.localize import localize
@@ -34,17 +35,19 @@ def alac(pstream, refrfile, threads=1, ksize=31, maxreads=10000, delta=50,
     for partid, gdna in targeter:
         targets_by_partition[partid].append(gdna)
 
+    partitions = [
+        (partid, targets_by_partition[partid], contigs_by_partition[partid])
+        for partid in sorted(targets_by_partition)
+    ]
     calls = list()
-    for partid in sorted(targets_by_partition):
-        gdnalist = targets_by_partition[partid]
-        contigs = contigs_by_partition[partid]
-        caller = kevlar.call.call(
-            gdnalist, contigs, partid, match=match, mismatch=mismatch,
-            gapopen=gapopen, gapextend=gapextend, ksize=ksize,
-            refrfile=refrfile, maxtargetlen=maxtargetlen,
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        caller = kevlar.call.call_partitions(
+            partitions, executor, lookahead=4 * threads, match=match,
+            mismatch=mismatch, gapopen=gapopen, gapextend=gapextend,
+            ksize=ksize, refrfile=refrfile, maxtargetlen=maxtargetlen,
         )
-        partcalls = list(caller)
-        calls.extend(partcalls)
+        for partid, partcalls in caller:
+            calls.extend(partcalls)
     calls = sorted(calls, key=lambda c: (c.seqid, c.position))
     if maskfile:
         message = 'generating mask of variant-spanning k-mers'
@@ -9,11 +9,12 @@
 # distutils: sources = src/align.c
 # cython: c_string_type=str, c_string_encoding=ascii
 
-import kevlar
-
-cdef extern from 'align.h':
+cdef extern from 'align.h' nogil:
     void align(const char *target, const char *query, int match, int mismatch,
                int gapopen, int gapextend, char *cigar, int *score)
+    void c_align_both_strands 'align_both_strands'(
+        const char *target, const char *query, int match, int mismatch,
+        int gapopen, int gapextend, char *cigar, int *score, int *strand)
 
 
 def contig_align(target, query, int match=1, int mismatch=2, int gapopen=5,
@@ -26,19 +27,15 @@ def contig_align(target, query, int match=1, int mismatch=2, int gapopen=5,
 
 def align_both_strands(target, query, int match=1, int mismatch=2,
                        int gapopen=5, int gapextend=0):
-    cigar1, score1 = contig_align(
-        target.sequence, query.sequence, match, mismatch, gapopen, gapextend
-    )
-    cigar2, score2 = contig_align(
-        target.sequence, kevlar.revcom(query.sequence), match, mismatch,
-        gapopen, gapextend
-    )
-    if score2 > score1:
-        cigar = cigar2
-        score = score2
-        strand = -1
-    else:
-        cigar = cigar1
-        score = score1
-        strand = 1
+    cdef char cigar[4096]
+    cdef int score
+    cdef int strand
+    tseq, qseq = target.sequence, query.sequence
+    cdef const char *tptr = tseq
+    cdef const char *qptr = qseq
+    with nogil:
+        c_align_both_strands(
+            tptr, qptr, match, mismatch, gapopen, gapextend, cigar, &score,
+            &strand
+        )
     return score, cigar, strand
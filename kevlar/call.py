@@ -7,7 +7,8 @@
 # licensed under the MIT license: see LICENSE.
 # -----------------------------------------------------------------------------
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import kevlar
 from kevlar.varmap import VariantMapping
 from kevlar.vcf import VariantFilter as vf
@@ -30,7 +31,7 @@ def alignments_to_report(alignments):
         finallist = alignments
     else:
         finallist = scrtbl
-    bestscore = max([aln.score for aln in finallist])
+    bestscore = max(aln.score for aln in finallist)
     aligns2report = [aln for aln in finallist if aln.score == bestscore]
     return aligns2report
 
@@ -43,11 +44,9 @@ def dedup(callstream):
         calls[call.seqid][call.position].add(call)
     for seqid in sorted(calls):
         for position in sorted(calls[seqid]):
-            sortedcalls = sorted(
-                calls[seqid][position], key=lambda call: call.windowlength,
-                reverse=True
+            yield max(
+                calls[seqid][position], key=lambda call: call.windowlength
             )
-            yield sortedcalls[0]
 
 
 def merge_adjacent(callstream):
@@ -66,11 +65,22 @@ def merge_adjacent(callstream):
 
 def prelim_call(targetlist, querylist, partid=None, match=1, mismatch=2,
                 gapopen=5, gapextend=0, ksize=31, refrfile=None, debug=False,
-                mindist=5, homopolyfilt=True, maxtargetlen=10000):
-    """Implement the `kevlar call` procedure as a generator function."""
-    for query in sorted(querylist, reverse=True, key=len):
+                mindist=5, homopolyfilt=True, maxtargetlen=10000,
+                executor=None):
+    """Implement the `kevlar call` procedure.
+
+    Each query (contig) is aligned to all targets (reference cutouts)
+    independently. If an `executor` is provided, the alignments for each query
+    are submitted to it immediately, so that alignments for several partitions
+    can be computed concurrently (the alignment code releases the GIL).
+    Otherwise alignments are computed lazily as calls are consumed. Either way,
+    calls are reported in the same order.
+    """
+    targets = sorted(targetlist, key=lambda cutout: cutout.defline)
+
+    def align_query(query):
         alignments = list()
-        for target in sorted(targetlist, key=lambda cutout: cutout.defline):
+        for target in targets:
             nocall = False
             if maxtargetlen and len(target) > maxtargetlen:
                 nocall = True
@@ -79,6 +89,24 @@ def prelim_call(targetlist, querylist, partid=None, match=1, mismatch=2,
                 gapextend=gapextend, homopolyfilt=homopolyfilt, nocall=nocall,
             )
             alignments.append(mapping)
+        return alignments
+
+    queries = sorted(querylist, reverse=True, key=len)
+    if executor is None:
+        alignmentlists = map(align_query, queries)
+    else:
+        futures = [executor.submit(align_query, query) for query in queries]
+        alignmentlists = (future.result() for future in futures)
+    return call_alignments(
+        alignmentlists, partid=partid, ksize=ksize, mindist=mindist,
+        debug=debug,
+    )
+
+
+def call_alignments(alignmentlists, partid=None, ksize=31, mindist=5,
+                    debug=False):
+    """Call variants from the alignments of each query to all targets."""
+    for alignments in alignmentlists:
         aligns2report = alignments_to_report(alignments)
         for n, alignment in enumerate(aligns2report):
             if debug:
@@ -98,8 +126,25 @@ def call(*args, **kwargs):
 
     This function applies a deduplication procedure to preliminary calls.
     """
-    for call in merge_adjacent(dedup(prelim_call(*args, **kwargs))):
-        yield call
+    return merge_adjacent(dedup(prelim_call(*args, **kwargs)))
+
+
+def call_partitions(partitions, executor, lookahead=1, **kwargs):
+    """Call variants for a stream of partitions using a shared executor.
+
+    Each item of `partitions` is a `(partid, gdnas, contigs)` tuple. Contig
+    alignments are submitted to `executor` for up to `lookahead` partitions
+    beyond the one currently being reported. Calls are yielded one partition
+    at a time, in input order, as `(partid, calls)` tuples.
+    """
+    pending = deque()
+    for partid, gdnas, contigs in partitions:
+        caller = call(gdnas, contigs, partid, executor=executor, **kwargs)
+        pending.append((partid, caller))
+        if len(pending) > lookahead:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
 
 
 def load_contigs(contigstream):
@@ -144,24 +189,30 @@ def main(args):
         '[kevlar::call] processed contigs/gDNAs for {counter} partitions',
         interval=10, breaks=[100, 1000, 10000],
     )
-    for partid, gdnas in gdnastream:
-        progress_indicator.update()
-        if partid not in contigs_by_partition:
-            continue
-        contigs = contigs_by_partition[partid]
-        caller = call(
-            gdnas, contigs, partid, match=args.match, mismatch=args.mismatch,
-            gapopen=args.open, gapextend=args.extend, ksize=args.ksize,
-            refrfile=args.refr, debug=args.debug, mindist=5,
+
+    def partitions():
+        for partid, gdnas in gdnastream:
+            progress_indicator.update()
+            if partid not in contigs_by_partition:
+                continue
+            yield partid, gdnas, contigs_by_partition[partid]
+
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        caller = call_partitions(
+            partitions(), executor, lookahead=4 * args.threads,
+            match=args.match, mismatch=args.mismatch, gapopen=args.open,
+            gapextend=args.extend, ksize=args.ksize, refrfile=args.refr,
+            debug=args.debug, mindist=5,
             homopolyfilt=not args.no_homopoly_filter,
             maxtargetlen=args.max_target_length,
         )
-        for varcall in caller:
-            if args.gen_mask:
-                window = varcall.attribute('ALTWINDOW')
-                if window is not None and len(window) >= args.ksize:
-                    mask.consume(window)
-            writer.write(varcall)
+        for partid, partcalls in caller:
+            for varcall in partcalls:
+                if args.gen_mask:
+                    window = varcall.attribute('ALTWINDOW')
+                    if window is not None and len(window) >= args.ksize:
+                        mask.consume(window)
+                writer.write(varcall)
     if args.gen_mask:
         fpr = khmer.calc_expected_collisions(mask, max_false_pos=1.0)
         if fpr > args.mask_max_fpr:
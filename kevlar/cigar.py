@@ -13,6 +13,7 @@ import re
 
 
 AlignmentBlock = namedtuple('AlignmentBlock', 'length type target query')
+_BLOCK_RE = re.compile(r'(\d+)([DIM])')
 
 
 class AlignmentTokenizer(object):
@@ -28,7 +29,7 @@ class AlignmentTokenizer(object):
     def _tokenize(self):
         target = self._target
         query = self._query
-        blocks = re.finditer(r'(\d+)([DIM])', self._origcigar)
+        blocks = _BLOCK_RE.finditer(self._origcigar)
         for block in blocks:
             length = int(block.group(1))
             blocktype = block.group(2)
@@ -65,6 +65,9 @@ def subparser(subparsers):
                            help='output file; default is terminal (stdout)')
     misc_args.add_argument('-k', '--ksize', type=int, default=31, metavar='K',
                            help='k-mer size; default is 31')
+    misc_args.add_argument('-t', '--threads', type=int, default=1, metavar='T',
+                           help='process T partitions at a time using T '
+                           'threads; default is 1')
     subparser.add_argument('queryseq', help='contigs assembled by "kevlar '
                            'assemble"')
     subparser.add_argument('targetseq', help='region of reference genome '
@@ -19,6 +19,9 @@ import pysam
 import screed
 
 
+_CUTOUT_DEFLINE_RE = re.compile(r'(\S+)_(\d+)-(\d+)')
+
+
 class KevlarBWAError(RuntimeError):
     """Raised if a delegated BWA call fails for any reason."""
     pass
@@ -115,7 +118,7 @@ class ReferenceCutout(object):
         return self._endpos - self._startpos
 
     def parse_defline(self, defline):
-        match = re.search(r'(\S+)_(\d+)-(\d+)', defline)
+        match = _CUTOUT_DEFLINE_RE.search(defline)
         if not match:
             raise KevlarInvalidCutoutDeflineError(defline)
         self._seqid = match.group(1)
@@ -23,6 +23,24 @@ def revcom(str sequence):
     return sequence.translate(revcomptab)[::-1]
 
 
+def mismatch_positions(str qseq, str tseq):
+    """Find the positions at which two equal-length sequences differ."""
+    cdef const char *query = qseq
+    cdef const char *target = tseq
+    cdef Py_ssize_t length = len(qseq)
+    cdef Py_ssize_t i
+    if len(tseq) != length:
+        message = 'sequence length mismatch: {:d} vs {:d}'.format(
+            length, len(tseq)
+        )
+        raise ValueError(message)
+    diffs = list()
+    for i in range(length):
+        if query[i] != target[i]:
+            diffs.append(i)
+    return diffs
+
+
 def tostr(stringlike):
     try:
         stringlike = stringlike.decode('utf-8')
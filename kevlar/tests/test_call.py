@@ -8,6 +8,7 @@
 # -----------------------------------------------------------------------------
 
 
+from concurrent.futures import ThreadPoolExecutor
 import filecmp
 import kevlar
 from kevlar.call import call
@@ -452,3 +453,56 @@ def test_call_max_target_length_cli(capsys):
     assert len(calllines) == 1
     assert calllines[0].startswith('.\t.\t.\t.\t.')
     assert 'PASS' not in calllines[0]
+
+
+def test_call_threads():
+    contigfile = data_file('bee-dupl.contigs.augfasta')
+    contigstream = kevlar.parse_augmented_fastx(kevlar.open(contigfile, 'r'))
+    contigs = list(contigstream)
+
+    gdnafile = data_file('bee-dupl.gdna.fa')
+    gdnastream = kevlar.reference.load_refr_cutouts(kevlar.open(gdnafile, 'r'))
+    targets = list(gdnastream)
+
+    serialcalls = list(kevlar.call.prelim_call(targets, contigs))
+    assert len(serialcalls) > 0
+    for threads in (2, 4):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            caller = kevlar.call.prelim_call(
+                targets, contigs, executor=executor
+            )
+            threadedcalls = list(caller)
+        assert [c.vcf for c in threadedcalls] == [c.vcf for c in serialcalls]
+
+
+def test_call_partitions():
+    contigfile = data_file('fiveparts.contigs.augfasta.gz')
+    contigstream = kevlar.parse_partitioned_reads(
+        kevlar.parse_augmented_fastx(kevlar.open(contigfile, 'r'))
+    )
+    contigs_by_partition = kevlar.call.load_contigs(contigstream)
+
+    gdnafile = data_file('fiveparts.gdnas.fa.gz')
+    gdnastream = kevlar.parse_partitioned_reads(
+        kevlar.reference.load_refr_cutouts(kevlar.open(gdnafile, 'r'))
+    )
+    partitions = [
+        (partid, list(gdnas), contigs_by_partition[partid])
+        for partid, gdnas in gdnastream if partid in contigs_by_partition
+    ]
+
+    serialcalls = list()
+    for partid, gdnas, contigs in partitions:
+        serialcalls.extend(call(gdnas, contigs, partid))
+    assert len(serialcalls) > 0
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        caller = kevlar.call.call_partitions(partitions, executor, lookahead=2)
+        partids = list()
+        threadedcalls = list()
+        for partid, partcalls in caller:
+            partids.append(partid)
+            threadedcalls.extend(partcalls)
+    assert partids == [p[0] for p in partitions]
+    assert sorted(c.vcf for c in threadedcalls) == sorted(
+        c.vcf for c in serialcalls
+    )
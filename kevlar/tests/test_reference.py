@@ -41,6 +41,13 @@ def test_cutout_basic():
     with pytest.raises(KevlarDeflineSequenceLengthMismatchError):
         c5 = ReferenceCutout('scaffold_4000-5000', 'A' * 42)
 
+    c6 = ReferenceCutout('chrUn_gl000220_80-380 kvcc=14')
+    assert c6.interval == ('chrUn_gl000220', 80, 380)
+
+    for defline in ('_1000-2000', 'chr1_1000'):
+        with pytest.raises(KevlarInvalidCutoutDeflineError):
+            ReferenceCutout(defline)
+
 
 def test_load_cutouts():
     instream = kevlar.open(data_file('ssc218.gdna.fa'), 'r')
@@ -12,7 +12,7 @@ import pytest
 import kevlar
 from kevlar.tests import data_file
 from kevlar.seqio import KevlarPartitionLabelError
-from kevlar.sequence import KmerOfInterest, Record
+from kevlar.sequence import KmerOfInterest, Record, mismatch_positions
 import khmer
 import pysam
 import screed
@@ -250,3 +250,22 @@ def test_ikmer_out_of_bounds():
     reader = kevlar.parse_augmented_fastx(fh)
     with pytest.raises(AssertionError, match=r"('TACGACAGAC', 'TACGACAGACA')"):
         list(reader)
+
+
+@pytest.mark.parametrize('qseq,tseq,positions', [
+    ('ACGTACGT', 'ACGTACGT', []),
+    ('ACGTACGT', 'ACGAACGT', [3]),
+    ('ACGTACGT', 'TCGTACGA', [0, 7]),
+    ('acgtACGT', 'ACGTACGT', [0, 1, 2, 3]),
+])
+def test_mismatch_positions(qseq, tseq, positions):
+    assert mismatch_positions(qseq, tseq) == positions
+
+
+@pytest.mark.parametrize('qseq,tseq', [
+    ('ACGTACGT', 'ACGT'),
+    ('ACGT', 'ACGTACGT'),
+])
+def test_mismatch_positions_length_mismatch(qseq, tseq):
+    with pytest.raises(ValueError, match=r'sequence length mismatch'):
+        mismatch_positions(qseq, tseq)
@@ -7,9 +7,11 @@
 # licensed under the MIT license: see LICENSE.
 # -----------------------------------------------------------------------------
 
+import re
 import sys
 import kevlar
-from kevlar.varmap import VariantMapping
+from kevlar.cigar import AlignmentBlock
+from kevlar.varmap import VariantMapping, alignment_vartype
 from kevlar.tests import data_file
 import pytest
 import screed
@@ -322,3 +324,29 @@ def test_drop_numerous_mismatches():
     assert calls[0].filterstr == 'NumerousMismatches'
     assert calls[0]._refr == '.'
     assert calls[0]._alt == '.'
+
+
+@pytest.mark.parametrize('cigar,vartype', [
+    ('100M', 'snv'),
+    ('25D100M', 'snv'),
+    ('100M25D', 'snv'),
+    ('25D100M25D', 'snv'),
+    ('5I100M10D', 'snv'),
+    ('50D132M1D125M50D', 'indel'),
+    ('132M3I125M', 'indel'),
+    ('10D50M2I50M', 'indel'),
+    ('50M1D50M5D', 'indel'),
+    ('10D91M69D79M20I', 'indel'),
+    ('', None),
+    ('25D', None),
+    ('25D5I100M', None),
+    ('100M25D10I', None),
+    ('50M1D50M1I50M', None),
+    ('10D50M1I50M1D50M10D', None),
+])
+def test_alignment_vartype(cigar, vartype):
+    blocks = [
+        AlignmentBlock(int(length), blocktype, None, None)
+        for length, blocktype in re.findall(r'(\d+)([DIM])', cigar)
+    ]
+    assert alignment_vartype(blocks) == vartype
@@ -8,10 +8,10 @@
 # -----------------------------------------------------------------------------
 
 from itertools import chain
-import re
 import kevlar
 from kevlar.alignment import align_both_strands
 from kevlar.cigar import AlignmentTokenizer
+from kevlar.sequence import mismatch_positions
 from kevlar.vcf import Variant
 from kevlar.vcf import VariantFilter as vf
 
@@ -35,6 +35,8 @@ class VariantMapping(object):
         self.cutout = cutout
         self.nocall = nocall
         self.vartype = None
+        self._varseq = None
+        self._ikmerseqs = None
         if nocall:
             self.score = 0
             return
@@ -46,12 +48,7 @@ class VariantMapping(object):
         self.tok = AlignmentTokenizer(self.varseq, self.refrseq, cigar)
         self.cigar = self.tok._cigar
 
-        snvpattern = r'^((\d+)([DI]))?(\d+)M((\d+)[DI])?$'
-        indelpattern = r'^((\d+)([DI]))?(\d+)M(\d+)([ID])(\d+)M((\d+)[DI])?$'
-        if re.search(snvpattern, self.cigar):
-            self.vartype = 'snv'
-        elif re.search(indelpattern, self.cigar):
-            self.vartype = 'indel'
+        self.vartype = alignment_vartype(self.tok.blocks)
 
     def __str__(self):
         fulltarget, fullquery = '', ''
@@ -79,20 +76,28 @@ class VariantMapping(object):
     def interval(self):
         return self.cutout.interval
 
+    @property
+    def ikmerseqs(self):
+        """Interesting k-mer sequences of the contig, paired with revcoms."""
+        if self._ikmerseqs is None:
+            self._ikmerseqs = ikmer_sequences(self.contig)
+        return self._ikmerseqs
+
     @property
     def ikmers(self):
-        for kmer in self.contig.annotations:
-            seq = self.contig.ikmerseq(kmer)
+        for seq, seqrc in self.ikmerseqs:
             yield seq
-            yield kevlar.revcom(seq)
+            yield seqrc
 
     @property
     def varseq(self):
-        assert self.strand in (-1, 1)
-        if self.strand == 1:
-            return self.contig.sequence
-        else:
-            return kevlar.revcom(self.contig.sequence)
+        if self._varseq is None:
+            assert self.strand in (-1, 1)
+            if self.strand == 1:
+                self._varseq = self.contig.sequence
+            else:
+                self._varseq = kevlar.revcom(self.contig.sequence)
+        return self._varseq
 
     @property
     def refrseq(self):
@@ -155,10 +160,10 @@ class VariantMapping(object):
         return self.tok.blocks[i]
 
     def is_passenger(self, call):
-        if call.window is None:
+        window = call.window
+        if window is None:
             return False
-        numikmers = sum([1 for k in self.ikmers if k in call.window])
-        return numikmers == 0
+        return not any(k in window for k in self.ikmers)
 
     def homopolymer_filter(self):
         if not self.do_homopolymer_filter:
@@ -242,7 +247,7 @@ class VariantMapping(object):
         assert len(tseq) == length
         if length < ksize:
             return
-        diffs = [i for i in range(length) if tseq[i] != qseq[i]]
+        diffs = mismatch_positions(qseq, tseq)
         if mindist:
             self.trimmed, diffs = trim_terminal_snvs(diffs, length, mindist)
         if len(diffs) == 0 or len(diffs) > 4:
@@ -269,7 +274,7 @@ class VariantMapping(object):
             alt = qseq[pos].upper()
             localcoord = pos + offset
             globalcoord = self.cutout.local_to_global(localcoord)
-            nikmers = n_ikmers_present(self.contig, altwindow)
+            nikmers = n_ikmers_present(self.contig, altwindow, self.ikmerseqs)
             snv = Variant(
                 self.seqid, globalcoord, refr, alt, CONTIG=qseq,
                 CIGAR=self.cigar, KSW2=str(self.score), IKMERS=str(nikmers),
@@ -294,7 +299,7 @@ class VariantMapping(object):
                 + self.indel.query \
                 + self.rightflank.query[:(ksize-1)]
             altallele = self.leftflank.query[-1] + self.indel.query
-        nikmers = n_ikmers_present(self.contig, altwindow)
+        nikmers = n_ikmers_present(self.contig, altwindow, self.ikmerseqs)
         localcoord = 0 if self.targetshort else self.offset
         localcoord += self.leftflank.length
         globalcoord = self.cutout.local_to_global(localcoord)
@@ -306,13 +311,46 @@ class VariantMapping(object):
         yield indel
 
 
-def n_ikmers_present(record, window):
-    n = 0
+def alignment_vartype(blocks):
+    """Determine the type of variant an alignment can be interpreted as.
+
+    The alignment blocks are walked once as a small state machine. An
+    optional leading gap is followed by a match, then an optional gap and
+    match (an indel), and finally an optional trailing gap. Alignments of this
+    form are interpretable as an SNV (`'snv'`) or an indel (`'indel'`); any
+    other alignment structure is uninterpretable (`None`).
+    """
+    types = [block.type for block in blocks]
+    numblocks = len(types)
+    i = 0
+    if i < numblocks and types[i] != 'M':
+        i += 1
+    if i >= numblocks or types[i] != 'M':
+        return None
+    i += 1
+    vartype = 'snv'
+    if i + 1 < numblocks and types[i] != 'M' and types[i + 1] == 'M':
+        vartype = 'indel'
+        i += 2
+    if i < numblocks and types[i] != 'M':
+        i += 1
+    return vartype if i == numblocks else None
+
+
+def ikmer_sequences(record):
+    ikmerseqs = list()
     for ikmer in record.annotations:
         seq = record.ikmerseq(ikmer)
-        if seq in window:
-            n += 1
-        elif kevlar.revcom(seq) in window:
+        ikmerseqs.append((seq, kevlar.revcom(seq)))
+    return ikmerseqs
+
+
+def n_ikmers_present(record, window, ikmerseqs=None):
+    if ikmerseqs is None:
+        ikmerseqs = ikmer_sequences(record)
+    n = 0
+    for seq, seqrc in ikmerseqs:
+        if seq in window or seqrc in window:
             n += 1
     return n
 
@@ -11,6 +11,7 @@ from collections import defaultdict
 from datetime import date
 from enum import Enum
 import kevlar
+import sys
 from numpy import float64
 
 
@@ -64,6 +65,10 @@ class FormattedList(list):
 class Variant(object):
     """Base class for handling variant calls and no-calls."""
 
+    __slots__ = (
+        '_seqid', '_pos', '_refr', '_alt', '_filters', 'info', '_sample_data'
+    )
+
     def __init__(self, seqid, pos, refr, alt, **kwargs):
         """
         Constructor method.
@@ -72,7 +77,7 @@ class Variant(object):
         Setting the `refr` or `alt` parameters to `.` will designate this
         variant as a "no call".
         """
-        self._seqid = seqid
+        self._seqid = sys.intern(seqid)
         self._pos = pos
         self._refr = refr
         self._alt = alt
@@ -122,22 +127,22 @@ class Variant(object):
         """Print variant to VCF."""
         attrstr = '.'
         if len(self.info) > 0:
-            kvpairs = list()
-            for key in sorted(self.info):
-                if key != 'CONTIG':
-                    kvpairs.append(self.attribute(key, pair=True))
-            queryseq = self.attribute('CONTIG', pair=True)
-            if queryseq:
-                kvpairs.append(queryseq)
+            info = self.info
+            kvpairs = [
+                key + '=' + str(info[key]) for key in sorted(info)
+                if key != 'CONTIG'
+            ]
+            if 'CONTIG' in info:
+                kvpairs.append('CONTIG=' + str(info['CONTIG']))
             attrstr = ';'.join(kvpairs)
 
         pos = self.position
         if pos != '.':
             pos += 1
-        return '{:s}\t{}\t.\t{:s}\t{:s}\t.\t{:s}\t{:s}'.format(
-            self._seqid, pos, self._refr, self._alt, self.filterstr,
-            attrstr
-        )
+        return '\t'.join((
+            self._seqid, str(pos), '.', self._refr, self._alt, '.',
+            self.filterstr, attrstr
+        ))
 
     @property
     def cigar(self):
@@ -401,10 +406,11 @@ class VCFWriter(object):
     def write(self, variant):
         fmt_fields = list()
         outfmt = None
+        fmtkeys = sorted(self.format_metadata) if self._sample_labels else ()
         for sample in self._sample_labels:
             fmt = list()
             values = list()
-            for field in sorted(self.format_metadata.keys()):
+            for field in fmtkeys:
                 value = variant.format(sample, field)
                 if value:
                     fmt.append(field)
@@ -418,10 +424,10 @@ class VCFWriter(object):
                     msg += ' ({:s} vs {:s})'.format(outfmt, fmtstr)
                     raise VariantAnnotationError(msg)
             fmt_fields.append(':'.join(values))
-        print(variant.vcf, end='', file=self._out)
+        line = variant.vcf
         if len(fmt_fields) > 0:
-            print('', outfmt, *fmt_fields, sep='\t', end='', file=self._out)
-        print('\n', end='', file=self._out)
+            line += '\t' + outfmt + '\t' + '\t'.join(fmt_fields)
+        self._out.write(line + '\n')
 
 
 class VCFReader(object):
@@ -441,10 +447,11 @@ class VCFReader(object):
         for kvp in fields[7].split(';'):
             if '=' in kvp:
                 key, values = kvp.split('=')
+                key = sys.intern(key)
                 for value in values.split(','):
                     variant.annotate(key, value)
             else:
-                variant.annotate(kvp, True)
+                variant.annotate(sys.intern(kvp), True)
         if filterstr not in ('.', 'PASS'):
             for filterlabel in filterstr.split(';'):
                 if hasattr(VariantFilter, filterlabel):
@@ -13,11 +13,12 @@
  * Encode the given nucleotide sequence.
  *
  * @param sequence    nucleotide sequence
+ * @param length      length of the nucleotide sequence
  * @returns           pointer to an array of uint8_t; array is allocated on the
                       heap, and calling function is responsible to free the
                       memory
  */
-static uint8_t* encode(const char *sequence)
+static uint8_t* encode(const char *sequence, size_t length)
 {
     uint8_t table[256];
     memset(table, 4, 256);
@@ -26,9 +27,9 @@ static uint8_t* encode(const char *sequence)
     table[(int)'G'] = table[(int)'g'] = 2;
     table[(int)'T'] = table[(int)'t'] = 3;
 
-    uint8_t *int_seq = (uint8_t *)malloc(strlen(sequence));
+    uint8_t *int_seq = (uint8_t *)malloc(length);
     size_t i = 0;
-    for (i = 0; i < strlen(sequence); i++) {
+    for (i = 0; i < length; i++) {
         int_seq[i] = table[(uint8_t)sequence[i]];
     }
 
@@ -36,48 +37,148 @@ static uint8_t* encode(const char *sequence)
 }
 
 
-// See align.h for documentation.
-void align(const char *target, const char *query, int match, int mismatch,
-           int gapopen, int gapextend, char *cigar, int *score)
+/**
+ * Reverse complement an encoded nucleotide sequence.
+ *
+ * @param int_seq     encoded nucleotide sequence
+ * @param length      length of the encoded sequence
+ * @returns           pointer to an array of uint8_t; array is allocated on the
+                      heap, and calling function is responsible to free the
+                      memory
+ */
+static uint8_t* revcom_encoded(const uint8_t *int_seq, size_t length)
+{
+    uint8_t *rc_seq = (uint8_t *)malloc(length);
+    size_t i = 0;
+    for (i = 0; i < length; i++) {
+        uint8_t c = int_seq[length - i - 1];
+        rc_seq[i] = c < 4 ? 3 - c : c;
+    }
+    return rc_seq;
+}
+
+
+/**
+ * Populate the 5x5 scoring matrix for the {A,C,G,T,N} alphabet.
+ */
+static void score_matrix(int match, int mismatch, int8_t *matrix)
 {
     int8_t a = match; // a > 0
     int8_t b = mismatch < 0 ? mismatch : -mismatch; // b < 0
-    int8_t matrix[25] = {
+    int8_t values[25] = {
         a,b,b,b,0,
         b,a,b,b,0,
         b,b,a,b,0,
         b,b,b,a,0,
         0,0,0,0,0
     };
+    memcpy(matrix, values, sizeof(values));
+}
 
-    uint8_t *target_enc = encode(target);
-    uint8_t *query_enc = encode(query);
 
-    ksw_extz_t ez;
-    memset(&ez, 0, sizeof(ksw_extz_t));
+/**
+ * Align two encoded sequences with `ksw_extz`. The caller is responsible for
+ * freeing `ez->cigar`.
+ */
+static void align_encoded(const uint8_t *target_enc, size_t tlen,
+                          const uint8_t *query_enc, size_t qlen,
+                          const int8_t *matrix, int gapopen, int gapextend,
+                          ksw_extz_t *ez)
+{
+    memset(ez, 0, sizeof(ksw_extz_t));
     ksw_extz(
         NULL, // memory pool
-        strlen(query), query_enc,
-        strlen(target), target_enc,
+        qlen, query_enc,
+        tlen, target_enc,
         5, // alphabet size, |{A,C,G,T,N}|
         matrix, gapopen, gapextend,
         -1, // bandwidth
         -1, // zdrop
         0, //flag
-        &ez
+        ez
     );
+}
 
-    *score = ez.score;
 
+/**
+ * Write the alignment path as a CIGAR string.
+ */
+static void write_cigar(const ksw_extz_t *ez, char *cigar)
+{
     // Stolen shamelessly from ksw2/cli.c
     size_t ci = 0;
     size_t i = 0;
-    for (i = 0; i < ez.n_cigar; ++i) {
+    cigar[0] = '\0';
+    for (i = 0; i < ez->n_cigar; ++i) {
         ci += sprintf(
-            cigar + ci, "%d%c", ez.cigar[i] >> 4,"MID"[ez.cigar[i]&0xf]
+            cigar + ci, "%d%c", ez->cigar[i] >> 4,"MID"[ez->cigar[i]&0xf]
         );
     }
+}
+
+
+// See align.h for documentation.
+void align(const char *target, const char *query, int match, int mismatch,
+           int gapopen, int gapextend, char *cigar, int *score)
+{
+    int8_t matrix[25];
+    score_matrix(match, mismatch, matrix);
+
+    size_t tlen = strlen(target);
+    size_t qlen = strlen(query);
+    uint8_t *target_enc = encode(target, tlen);
+    uint8_t *query_enc = encode(query, qlen);
+
+    ksw_extz_t ez;
+    align_encoded(
+        target_enc, tlen, query_enc, qlen, matrix, gapopen, gapextend, &ez
+    );
+    *score = ez.score;
+    write_cigar(&ez, cigar);
+
+    free(ez.cigar);
+    free(query_enc);
+    free(target_enc);
+}
+
+
+// See align.h for documentation.
+void align_both_strands(const char *target, const char *query, int match,
+                        int mismatch, int gapopen, int gapextend, char *cigar,
+                        int *score, int *strand)
+{
+    int8_t matrix[25];
+    score_matrix(match, mismatch, matrix);
+
+    size_t tlen = strlen(target);
+    size_t qlen = strlen(query);
+    uint8_t *target_enc = encode(target, tlen);
+    uint8_t *query_enc = encode(query, qlen);
+    uint8_t *query_rc_enc = revcom_encoded(query_enc, qlen);
+
+    ksw_extz_t ez_fwd, ez_rev;
+    align_encoded(
+        target_enc, tlen, query_enc, qlen, matrix, gapopen, gapextend, &ez_fwd
+    );
+    align_encoded(
+        target_enc, tlen, query_rc_enc, qlen, matrix, gapopen, gapextend,
+        &ez_rev
+    );
+
+    if (ez_rev.score > ez_fwd.score) {
+        *score = ez_rev.score;
+        *strand = -1;
+        write_cigar(&ez_rev, cigar);
+    }
+    else {
+        *score = ez_fwd.score;
+        *strand = 1;
+        write_cigar(&ez_fwd, cigar);
+    }
 
+    free(ez_fwd.cigar);
+    free(ez_rev.cigar);
+    free(query_rc_enc);
     free(query_enc);
     free(target_enc);
 }